@@ -1,12 +1,15 @@
 "use client"
 
 import { useState } from "react"
+import dynamic from "next/dynamic"
 import { Button } from "@/components/ui/button"
 import { Badge } from "@/components/ui/badge"
-import DarkVeil from "@/components/DarkVeil"
 import AudioProcessor from "@/components/audio-processor"
 import { Brain, Mic, Languages, Sparkles, Github, Menu, X } from "lucide-react"
 
+// The WebGL background pulls in ogl; load it after the page is interactive
+const DarkVeil = dynamic(() => import("@/components/DarkVeil"), { ssr: false })
+
 export default function MeetingMindApp() {
   const [mobileMenuOpen, setMobileMenuOpen] = useState(false)
 